@@ -0,0 +1,413 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import onnxruntime as ort
+import onnx
+from onnxruntime.quantization import quantize_dynamic, QuantType
+import tempfile
+import os
+import contextlib
+import io
+import threading
+from dataclasses import dataclass, field
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import requests
+import hashlib
+
+# 🔗 Map display names to GitHub raw URLs
+MODEL_OPTIONS = {
+    "2L to 5L": "https://raw.githubusercontent.com/code2mech/App/main/2L_5L.onnx",
+    "10L to 20L": "https://raw.githubusercontent.com/code2mech/App/main/10L_20L.onnx",
+    "800L to 2000L": "https://raw.githubusercontent.com/code2mech/App/main/800L_2000L.onnx"
+}
+
+# Optimized models are serialized here so later sessions skip the optimizer
+ORT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "ort_cache")
+
+# ORT runs on a single worker thread, off the Streamlit script thread
+_EXEC = ThreadPoolExecutor(max_workers=1)
+
+# Seconds to wait for more requests to join a batch once several are queued
+BATCH_TIMEOUT = 0.005
+
+# Models kept warm, both as live sessions and as optimized files on disk;
+# uploads make every distinct model a new entry
+CACHE_MAX_ENTRIES = 8
+
+# Accelerated providers in order of preference, CPU as the fallback
+GPU_PROVIDERS = ("TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider")
+
+# Below this many rows the host-to-device copy outweighs any GPU speedup
+GPU_MIN_BATCH = 32
+
+# Relative tolerance an INT8 model must meet against the FP32 model to be used
+QUANT_RTOL = 1e-2
+
+# (volume, impeller speed) rows the INT8 model is checked on: volumes across
+# the bundled models' 2 L to 2000 L ranges at low to high impeller speeds
+QUANT_PROBE_ROWS = [
+    (volume, speed)
+    for volume in (2.0, 5.0, 10.0, 20.0, 800.0, 2000.0)
+    for speed in (50.0, 100.0, 300.0, 1000.0)
+]
+
+# 🏷 Custom output labels
+OUTPUT_LABELS = ["Shear Rate", "Power", "Tip Speed", "Reynolds Number", "Power Number"]
+
+def download_model_from_github(url):
+    # Streamed into an on-disk cache keyed by URL and revalidated with its
+    # ETag, so an unchanged model is answered by a 304 without a body
+    os.makedirs(ORT_CACHE_DIR, exist_ok=True)
+    model_path = os.path.join(ORT_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".onnx")
+    etag_path = model_path + ".etag"
+
+    headers = {}
+    if os.path.exists(model_path) and os.path.exists(etag_path):
+        with open(etag_path) as f:
+            etag = f.read()
+        if etag:
+            headers["If-None-Match"] = etag
+
+    with requests.get(url, stream=True, headers=headers, timeout=30) as response:
+        if response.status_code != 304:
+            response.raise_for_status()
+            # Unbuffered: one write syscall per chunk, into a unique file so
+            # concurrent downloads of the same URL never share a .part
+            fd, part_path = tempfile.mkstemp(suffix=".part", dir=ORT_CACHE_DIR)
+            try:
+                try:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        os.write(fd, chunk)
+                finally:
+                    os.close(fd)
+                os.replace(part_path, model_path)
+            except BaseException:
+                # Don't leave a partial download behind
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(part_path)
+                raise
+            with open(etag_path, "w") as f:
+                f.write(response.headers.get("ETag", ""))
+
+    with open(model_path, "rb") as f:
+        return f.read()
+
+def load_model_bytes(model):
+    # A model is given either as its serialized bytes or as a URL to fetch
+    if isinstance(model, bytes):
+        return model
+    return download_model_from_github(model)
+
+def quantize_model(model_bytes, quant_path):
+    # Dynamic INT8 weight quantization, kept only if it shrinks the model
+    # and the predictions survive it; otherwise the FP32 model is used.
+    # Returns the model to serve and whether it is the INT8 one
+    try:
+        if not os.path.exists(quant_path):
+            # Written under a unique name and moved into place, so a partial
+            # file is never picked up by the existence check above
+            fd, tmp_path = tempfile.mkstemp(suffix=".onnx", dir=os.path.dirname(quant_path))
+            os.close(fd)
+            try:
+                quantize_dynamic(onnx.load_from_string(model_bytes), tmp_path, weight_type=QuantType.QInt8)
+                os.replace(tmp_path, quant_path)
+            finally:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+        with open(quant_path, "rb") as f:
+            quant_bytes = f.read()
+        if len(quant_bytes) >= len(model_bytes):
+            return model_bytes, False
+
+        reference = ort.InferenceSession(model_bytes, providers=["CPUExecutionProvider"])
+        quantized = ort.InferenceSession(quant_bytes, providers=["CPUExecutionProvider"])
+        input_info = reference.get_inputs()[0]
+        probe_shape = [dim if isinstance(dim, int) else 1 for dim in input_info.shape]
+        for row in QUANT_PROBE_ROWS:
+            probe = np.array(row, dtype=np.float32).reshape(probe_shape)
+            expected = reference.run(None, {input_info.name: probe})[0]
+            actual = quantized.run(None, {input_info.name: probe})[0]
+            if not np.allclose(actual, expected, rtol=QUANT_RTOL):
+                return model_bytes, False
+        return quant_bytes, True
+    except Exception:
+        return model_bytes, False
+
+@dataclass
+class Bound:
+    # A cached session with everything the hot path needs resolved up front
+    session: ort.InferenceSession
+    binding: ort.IOBinding
+    input_name: str
+    output_names: list
+    input_buf: np.ndarray
+    # Flat view of input_buf, so a [2] or [1, 2] input is written the same way
+    input_row: np.ndarray
+    input: ort.OrtValue
+    output: ort.OrtValue
+    # Rows can be stacked into one run only with a dynamic batch dimension
+    batchable: bool
+    # Serving the INT8 model rather than the FP32 one
+    quantized: bool = False
+    # Samples waiting for the executor, guarded by the lock
+    pending: list = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+def bind_session(session, quantized=False):
+    # Pre-allocate input/output buffers once so each run writes in place
+    input_info = session.get_inputs()[0]
+    output_info = session.get_outputs()[0]
+    if len(input_info.shape) not in (1, 2):
+        raise ValueError(f"Unexpected input shape: {input_info.shape}. Model should accept 1D or 2D input.")
+
+    # Dynamic (batch) dimensions are fixed to a single sample
+    input_shape = [dim if isinstance(dim, int) else 1 for dim in input_info.shape]
+    output_shape = [dim if isinstance(dim, int) else 1 for dim in output_info.shape]
+    # The input OrtValue wraps this array, so writing into it feeds ORT directly
+    input_buf = np.zeros(input_shape, dtype=np.float32)
+    input_ov = ort.OrtValue.ortvalue_from_numpy(input_buf)
+    output_ov = ort.OrtValue.ortvalue_from_shape_and_type(output_shape, np.float32, "cpu")
+
+    binding = session.io_binding()
+    binding.bind_ortvalue_input(input_info.name, input_ov)
+    binding.bind_ortvalue_output(output_info.name, output_ov)
+
+    bound = Bound(
+        session=session,
+        binding=binding,
+        input_name=input_info.name,
+        output_names=[output.name for output in session.get_outputs()],
+        input_buf=input_buf,
+        input_row=input_buf.reshape(-1),
+        input=input_ov,
+        output=output_ov,
+        batchable=len(input_info.shape) == 2 and not isinstance(input_info.shape[0], int),
+        quantized=quantized,
+    )
+
+    # Throwaway run so kernel selection and arena sizing happen while the
+    # session is cached, not on the first click; it goes through the executor
+    # like every other run on the bound buffers
+    _EXEC.submit(run_single, bound, 0.0, 0.0).result()
+    return bound
+
+def prune_disk_cache():
+    # Keep the optimized and quantized files of the CACHE_MAX_ENTRIES most
+    # recently used models; in-flight temp files don't have a sha1 name
+    last_used = {}
+    for name in os.listdir(ORT_CACHE_DIR):
+        key, _, suffix = name.partition(".")
+        if len(key) != 40 or suffix not in ("ort", "int8.onnx"):
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            mtime = os.path.getmtime(os.path.join(ORT_CACHE_DIR, name))
+            last_used[key] = max(last_used.get(key, 0), mtime)
+
+    for key in sorted(last_used, key=last_used.get, reverse=True)[CACHE_MAX_ENTRIES:]:
+        for suffix in (".ort", ".int8.onnx"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(ORT_CACHE_DIR, key + suffix))
+
+def session_options(optimization_level):
+    # Single-sample CPU inference: one thread avoids pool oversubscription
+    so = ort.SessionOptions()
+    so.intra_op_num_threads = 1
+    so.inter_op_num_threads = 1
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.graph_optimization_level = optimization_level
+    so.add_session_config_entry("session.disable_prepacking", "0")
+    return so
+
+@st.cache_resource(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, hash_funcs={bytes: lambda b: hashlib.sha1(b).hexdigest()})
+def get_session(model):
+    # Built once per model (bytes or URL) and shared by every page and rerun
+    # Fetch (or revalidate) first and key the caches on the model content, so
+    # a model that changed upstream never reuses a stale optimized file
+    model_bytes = load_model_bytes(model)
+
+    # Load the pre-optimized model if this one has been seen before
+    os.makedirs(ORT_CACHE_DIR, exist_ok=True)
+    cache_base = os.path.join(ORT_CACHE_DIR, hashlib.sha1(model_bytes).hexdigest())
+    cache_path = cache_base + ".ort"
+    # Only kept while the INT8 model is the one being served, so it also
+    # records which model a cached .ort was built from
+    quant_path = cache_base + ".int8.onnx"
+    if os.path.exists(cache_path):
+        so = session_options(ort.GraphOptimizationLevel.ORT_DISABLE_ALL)
+        try:
+            session = ort.InferenceSession(cache_path, so, providers=["CPUExecutionProvider"])
+        except Exception:
+            # Truncated, or written by a different onnxruntime build: rebuild it
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(cache_path)
+        else:
+            # Mark the entry as recently used for prune_disk_cache
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(cache_path)
+            return bind_session(session, quantized=os.path.exists(quant_path))
+
+    # ORT serializes the optimized model while building the session; write it
+    # under a unique name and move it into place so a crash never leaves a
+    # partial .ort behind
+    fd, tmp_path = tempfile.mkstemp(suffix=".ort", dir=ORT_CACHE_DIR)
+    os.close(fd)
+    so = session_options(ort.GraphOptimizationLevel.ORT_ENABLE_ALL)
+    so.optimized_model_filepath = tmp_path
+    try:
+        model_bytes, quantized = quantize_model(model_bytes, quant_path)
+        if not quantized:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(quant_path)
+        session = ort.InferenceSession(model_bytes, so, providers=["CPUExecutionProvider"])
+        os.replace(tmp_path, cache_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+    prune_disk_cache()
+    return bind_session(session, quantized=quantized)
+
+def gpu_providers():
+    available = ort.get_available_providers()
+    return [p for p in GPU_PROVIDERS if p in available]
+
+@st.cache_resource(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, hash_funcs={bytes: lambda b: hashlib.sha1(b).hexdigest()})
+def get_gpu_session(model):
+    # Built from the original model: the cached .ort file holds CPU-specific kernels
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(load_model_bytes(model), so, providers=gpu_providers())
+
+def run_single(bound, volume, impeller_speed):
+    # Write the two values into the bound input and run inference into the
+    # pre-allocated output buffer; only ever called on the executor thread
+    input_row = bound.input_row
+    input_row[0] = volume
+    input_row[1] = impeller_speed
+    bound.session.run_with_iobinding(bound.binding)
+    return bound.output.numpy().copy()
+
+def drain_pending(bound):
+    # Take whatever is queued without waiting. A lone sample, or a model that
+    # can't stack rows, is served at once; only when requests are already
+    # arriving together is it worth holding the worker for more to join
+    with bound.lock:
+        pending, bound.pending = bound.pending, []
+    if bound.batchable and len(pending) > 1:
+        time.sleep(BATCH_TIMEOUT)
+        with bound.lock:
+            pending, bound.pending = pending + bound.pending, []
+    # An earlier drain may already have served everything
+    if not pending:
+        return
+
+    try:
+        if len(pending) == 1 or not bound.batchable:
+            results = [run_single(bound, volume, impeller_speed) for volume, impeller_speed, _ in pending]
+        else:
+            inputs = np.array([[volume, impeller_speed] for volume, impeller_speed, _ in pending], dtype=np.float32)
+            outputs = bound.session.run(bound.output_names, {bound.input_name: inputs})[0]
+            results = [outputs[i:i + 1] for i in range(len(pending))]
+    except Exception as e:
+        for _, _, future in pending:
+            future.set_exception(e)
+        return
+
+    for (_, _, future), result in zip(pending, results):
+        future.set_result(result)
+
+def submit_inference(bound, volume, impeller_speed):
+    # Queue one sample; requests for the same model that queue up together
+    # are coalesced into a single ORT run on the executor thread
+    future = Future()
+    with bound.lock:
+        bound.pending.append((volume, impeller_speed, future))
+        if len(bound.pending) == 1:
+            _EXEC.submit(drain_pending, bound)
+    return future
+
+def predict(bound, volume, impeller_speed):
+    # Returns the first model output for a single sample
+    return submit_inference(bound, volume, impeller_speed).result()
+
+def predict_batch(bound, inputs):
+    # One run over an [N, 2] array; the bound buffers only fit a single sample.
+    # Models that take a single [2] or [1, 2] sample go row by row instead
+    if not bound.batchable:
+        def run_rows():
+            return [np.vstack([run_single(bound, v, s) for v, s in inputs])]
+
+        return _EXEC.submit(run_rows).result()
+
+    feed = {bound.input_name: inputs}
+    return _EXEC.submit(bound.session.run, bound.output_names, feed).result()
+
+def predict_batch_gpu(session, inputs):
+    # Inputs and outputs live on the device so ORT adds no Memcpy nodes
+    def run():
+        binding = session.io_binding()
+        binding.bind_ortvalue_input(session.get_inputs()[0].name, ort.OrtValue.ortvalue_from_numpy(inputs, "cuda", 0))
+        for output in session.get_outputs():
+            binding.bind_output(output.name, "cuda")
+        session.run_with_iobinding(binding)
+        return binding.copy_outputs_to_cpu()
+
+    return _EXEC.submit(run).result()
+
+def describe(bound):
+    # Model details for the diagnostic view; kept off the inference path
+    input_shape = bound.session.get_inputs()[0].shape
+    return {
+        "inputs": {bound.input_name: [dim if isinstance(dim, int) else str(dim) for dim in input_shape]},
+        "outputs": bound.output_names,
+        "providers": bound.session.get_providers(),
+        "batchable": bound.batchable,
+        "model": "INT8" if bound.quantized else "FP32",
+    }
+
+def batch_inference_section(model):
+    # 📁 Batch inference over every row of a CSV, shared by the pages
+    st.subheader("📁 Batch Inference")
+    batch_file = st.file_uploader(
+        "Upload a CSV with 'volume' and 'impeller_speed' columns", type=["csv"]
+    )
+    use_gpu = st.checkbox(
+        "Use GPU (batch mode only)",
+        disabled="CUDAExecutionProvider" not in ort.get_available_providers(),
+        help=f"Only used for batches of at least {GPU_MIN_BATCH} rows.",
+    )
+    if batch_file is None or not st.button("Run Batch Inference"):
+        return
+
+    with st.spinner("Running batch inference..."):
+        try:
+            df = pd.read_csv(batch_file)
+            inputs = df[["volume", "impeller_speed"]].to_numpy(dtype=np.float32)
+            bound = get_session(model)
+            if use_gpu and bound.batchable and len(inputs) >= GPU_MIN_BATCH:
+                outputs = predict_batch_gpu(get_gpu_session(model), inputs)[0]
+            else:
+                outputs = predict_batch(bound, inputs)[0]
+
+            # One row per input; a rank-1 output becomes a single column
+            outputs = outputs.reshape(len(inputs), -1)
+            columns = OUTPUT_LABELS if outputs.shape[1] == len(OUTPUT_LABELS) else None
+            batch_df = pd.concat(
+                [df[["volume", "impeller_speed"]], pd.DataFrame(outputs, columns=columns)],
+                axis=1,
+            )
+        except Exception as e:
+            st.error(f"Batch inference failed: {e}")
+            return
+
+    st.dataframe(batch_df)
+
+    # %.9g is the fewest digits that round-trip every float32
+    buf = io.BytesIO()
+    batch_df.to_csv(buf, index=False, float_format="%.9g")
+    st.download_button(
+        label="Download batch results as CSV",
+        data=buf.getvalue(),
+        file_name="batch_inference_results.csv",
+        mime="text/csv"
+    )
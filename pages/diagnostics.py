@@ -0,0 +1,53 @@
+import time
+import numpy as np
+import onnxruntime as ort
+import streamlit as st
+from inference_core import MODEL_OPTIONS, ORT_CACHE_DIR, get_session, predict, describe
+
+# Runs timed by the latency check
+LATENCY_RUNS = 100
+
+def main():
+    st.set_page_config(page_title="ONNX Model Diagnostics", layout="wide")
+    st.title("🔧 ONNX Model Diagnostics")
+
+    # Same model sources as the inference pages
+    source = st.radio("Model source", ["GitHub", "Upload"], horizontal=True)
+    if source == "GitHub":
+        model = MODEL_OPTIONS[st.selectbox("Select a model", list(MODEL_OPTIONS.keys()))]
+    else:
+        uploaded_file = st.file_uploader("Upload your ONNX model", type=["onnx"])
+        if uploaded_file is None:
+            st.info("Please upload an ONNX model to begin.")
+            return
+        model = uploaded_file.getvalue()
+
+    try:
+        bound = get_session(model)
+    except Exception as e:
+        st.error(f"Error loading model: {e}")
+        return
+
+    st.subheader("Model")
+    st.json(describe(bound))
+
+    st.subheader("Runtime")
+    st.json({
+        "onnxruntime": ort.__version__,
+        "available_providers": ort.get_available_providers(),
+        "cache_dir": ORT_CACHE_DIR,
+    })
+
+    if st.button(f"Time {LATENCY_RUNS} inferences"):
+        timings = []
+        for _ in range(LATENCY_RUNS):
+            start = time.perf_counter()
+            predict(bound, 1.0, 1.0)
+            timings.append((time.perf_counter() - start) * 1000)
+        st.write(
+            f"p50: {np.percentile(timings, 50):.3f} ms, "
+            f"p99: {np.percentile(timings, 99):.3f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import streamlit as st
+import pandas as pd
+from inference_core import MODEL_OPTIONS, OUTPUT_LABELS, get_session, predict, batch_inference_section
+
+def main():
+    st.set_page_config(page_title="ONNX Model Inference", layout="wide")
+    st.title("🧠 ONNX Model Inference from GitHub")
+
+    # 👇 Dropdown to choose model
+    selected_model_name = st.selectbox("Select a model", list(MODEL_OPTIONS.keys()))
+    selected_model_url = MODEL_OPTIONS[selected_model_name]
+
+    volume = st.number_input("Volume", value=1.0)
+    impeller_speed = st.number_input("Impeller Speed", value=1.0)
+
+    if st.button("Run Inference"):
+        with st.spinner(f"Running inference with {selected_model_name}..."):
+            try:
+                output = predict(get_session(selected_model_url), volume, impeller_speed)
+            except Exception as e:
+                st.error(f"Inference failed: {e}")
+            else:
+                output_array = output.reshape(-1)[:5]
+
+                st.subheader("📊 Results")
+                if len(output_array) >= 5:
+                    results_df = pd.DataFrame({"metric": OUTPUT_LABELS, "value": output_array[:5]})
+                else:
+                    st.warning("Not enough outputs to label. Showing raw values:")
+                    results_df = pd.DataFrame({
+                        "metric": [f"Output {i + 1}" for i in range(len(output_array))],
+                        "value": output_array,
+                    })
+                st.dataframe(results_df, hide_index=True)
+
+                # CSV Download
+                st.download_button(
+                    label="Download results as CSV",
+                    data=results_df.to_csv(index=False),
+                    file_name="inference_results.csv",
+                    mime="text/csv"
+                )
+
+    batch_inference_section(selected_model_url)
+
+if __name__ == "__main__":
+    main()
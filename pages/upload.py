@@ -0,0 +1,87 @@
+import streamlit as st
+from inference_core import get_session, predict, batch_inference_section
+
+def main():
+    st.set_page_config(
+        page_title="ONNX Model Inference",
+        page_icon="🧠",
+        layout="wide"
+    )
+
+    st.title("ONNX Model Inference Tool")
+    st.write("Upload your ONNX model and run inference in the cloud!")
+
+    # Create sidebar with information
+    with st.sidebar:
+        st.header("About")
+        st.info(
+            "This app allows you to upload an ONNX model and run inference with custom input values. "
+            "The model should accept two input values: Volume and Impeller Speed."
+        )
+        
+        st.header("Instructions")
+        st.markdown(
+            """
+            1. Upload your ONNX model using the file uploader
+            2. Enter the required input values
+            3. Click 'Run Inference' to see the results
+            """
+        )
+
+    # File uploader for the ONNX model
+    uploaded_file = st.file_uploader("Upload your ONNX model", type=["onnx"])
+
+    # Input fields for the two required values
+    st.subheader("Model Inputs")
+    col1, col2 = st.columns(2)
+    with col1:
+        volume = st.number_input("Volume", value=1.0, format="%.6f")
+    with col2:
+        impeller_speed = st.number_input("Impeller Speed", value=1.0, format="%.6f")
+
+    # Run inference when button is clicked
+    if uploaded_file is not None:
+        if st.button("Run Inference"):
+            with st.spinner("Running inference..."):
+                # Get the bytes from the uploaded file
+                model_bytes = uploaded_file.getvalue()
+                
+                # Run inference
+                try:
+                    output = predict(get_session(model_bytes), volume, impeller_speed)
+                except Exception as e:
+                    st.error(f"Error running inference: {e}")
+                else:
+                    # Display results in the specified format
+                    st.subheader("Results")
+                    
+                    # Assuming the outputs contain the values in a specific order
+                    # Modify the indices as needed based on your model's output structure
+                    output_array = output.reshape(-1)[:5]  # View of the first five values, no copy
+                    
+                    # Check if we have enough values
+                    if len(output_array) >= 5:
+                        # Display only the specific values in the requested format
+                        result_text = (
+                            f"Shear Rate: {output_array[0]}\n"
+                            f"Power: {output_array[1]}\n"
+                            f"Tip Speed: {output_array[2]}\n"
+                            f"Reynolds Number: {output_array[3]}\n"
+                            f"Power Number: {output_array[4]}"
+                        )
+                        st.text(result_text)
+                    else:
+                        st.warning("Output array doesn't contain enough values for all the requested parameters.")
+                        st.write(f"Available values: {output_array}")
+
+        # Batch inference: one run over every row of a CSV
+        batch_inference_section(uploaded_file.getvalue())
+    else:
+        st.info("Please upload an ONNX model to begin.")
+
+    # Add footer
+    st.markdown("---")
+    st.caption("ONNX Model Inference Tool - Powered by Streamlit and ONNX Runtime")
+
+if __name__ == "__main__":
+    main()